@@ -3,100 +3,159 @@ Farmer Training Module Generator
 AI-Powered Agricultural Advisory System
 """
 
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, render_template, stream_with_context
+from flask_orjson import OrjsonProvider
+from cachetools import TTLCache, cached
+from werkzeug.exceptions import RequestEntityTooLarge
 from datetime import datetime
+import fastjsonschema
+import functools
+import hashlib
+import itertools
+import jinja2
+import logging
+import orjson
+import os
+import sys
+import threading
+import time
+import zlib
+from types import MappingProxyType
 
 app = Flask(__name__)
 
+# orjson output is already compact and keeps insertion order (no sorting, no indentation)
+app.json = OrjsonProvider(app)  # Faster JSON encoding for large module content
+app.logger.setLevel(logging.INFO)  # Per-request debug logging stays off by default
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024  # Form data is only a few short fields
+
+
+def _freeze_entry(entry):
+    """
+    Build a read-only knowledge base entry
+    List values become tuples, and problem entries also get their steps and
+    techniques pre-joined, so modules can use them directly
+    """
+    frozen = {
+        field: tuple(value) if isinstance(value, list) else value
+        for field, value in entry.items()
+    }
+    if "steps" in frozen:
+        frozen["steps_block"] = "\n".join("   - " + step for step in frozen["steps"])
+        frozen["techniques_block"] = " • ".join(frozen["key_techniques"])
+    return MappingProxyType(frozen)
+
+
+def _freeze_table(table):
+    """
+    Build a read-only lookup table from a dict of entries
+    Keys are interned and every entry is frozen with _freeze_entry
+    """
+    return MappingProxyType({
+        sys.intern(key): _freeze_entry(entry)
+        for key, entry in table.items()
+    })
 
-class AgricultureExpert:
-    """Contains farming knowledge for common crops and problems"""
-    
-    # Farming knowledge database
-    CROP_INFO = {
-        "rice": {
-            "name": "Rice",
-            "season": "Kharif (June to October)",
-            "water": "Needs standing water, 5-7 cm depth",
-            "spacing": "20 cm between plants, 20 cm between rows",
-            "duration": "120-150 days from sowing to harvest"
-        },
-        "wheat": {
-            "name": "Wheat", 
-            "season": "Rabi (November to March)",
-            "water": "4-6 irrigations, avoid waterlogging",
-            "spacing": "5 cm between plants, 22 cm between rows",
-            "duration": "110-130 days"
-        },
-        "tomato": {
-            "name": "Tomato",
-            "season": "Year-round with care",
-            "water": "Regular watering, avoid wet leaves",
-            "spacing": "45 cm between plants, 60 cm between rows", 
-            "duration": "90-120 days"
-        }
+
+# Farming knowledge database for common crops and problems
+# (read-only views, so request handling cannot change them by accident)
+_CROP_INFO = _freeze_table({
+    "rice": {
+        "name": "Rice",
+        "season": "Kharif (June to October)",
+        "water": "Needs standing water, 5-7 cm depth",
+        "spacing": "20 cm between plants, 20 cm between rows",
+        "duration": "120-150 days from sowing to harvest"
+    },
+    "wheat": {
+        "name": "Wheat", 
+        "season": "Rabi (November to March)",
+        "water": "4-6 irrigations, avoid waterlogging",
+        "spacing": "5 cm between plants, 22 cm between rows",
+        "duration": "110-130 days"
+    },
+    "tomato": {
+        "name": "Tomato",
+        "season": "Year-round with care",
+        "water": "Regular watering, avoid wet leaves",
+        "spacing": "45 cm between plants, 60 cm between rows", 
+        "duration": "90-120 days"
     }
-    
-    PROBLEM_SOLUTIONS = {
-        "irrigation": {
-            "key_techniques": ["Drip irrigation", "Sprinkler systems", "Rainwater harvesting"],
-            "steps": [
-                "Measure soil moisture regularly",
-                "Water at plant roots, not leaves",
-                "Water early morning or evening",
-                "Adjust based on weather conditions"
-            ],
-            "benefits": "Saves 30-50% water, increases yield by 20-30%"
-        },
-        "pest control": {
-            "key_techniques": ["Integrated Pest Management", "Neem oil spray", "Companion planting"],
-            "steps": [
-                "Regular field inspection",
-                "Identify pest type correctly",
-                "Use natural predators first",
-                "Apply chemicals only if needed"
-            ],
-            "benefits": "Reduces chemical use by 40-60%, protects beneficial insects"
-        },
-        "soil health": {
-            "key_techniques": ["Organic compost", "Crop rotation", "Green manure"],
-            "steps": [
-                "Test soil every season",
-                "Add organic matter regularly",
-                "Maintain proper pH level",
-                "Avoid soil compaction"
-            ],
-            "benefits": "Improves yield by 25-40%, reduces fertilizer need"
-        }
+})
+
+_PROBLEM_SOLUTIONS = _freeze_table({
+    "irrigation": {
+        "key_techniques": ["Drip irrigation", "Sprinkler systems", "Rainwater harvesting"],
+        "steps": [
+            "Measure soil moisture regularly",
+            "Water at plant roots, not leaves",
+            "Water early morning or evening",
+            "Adjust based on weather conditions"
+        ],
+        "benefits": "Saves 30-50% water, increases yield by 20-30%"
+    },
+    "pest control": {
+        "key_techniques": ["Integrated Pest Management", "Neem oil spray", "Companion planting"],
+        "steps": [
+            "Regular field inspection",
+            "Identify pest type correctly",
+            "Use natural predators first",
+            "Apply chemicals only if needed"
+        ],
+        "benefits": "Reduces chemical use by 40-60%, protects beneficial insects"
+    },
+    "soil health": {
+        "key_techniques": ["Organic compost", "Crop rotation", "Green manure"],
+        "steps": [
+            "Test soil every season",
+            "Add organic matter regularly",
+            "Maintain proper pH level",
+            "Avoid soil compaction"
+        ],
+        "benefits": "Improves yield by 25-40%, reduces fertilizer need"
     }
-    
-    @staticmethod
-    def get_crop_details(crop_name):
-        """Get information about a specific crop"""
-        crop_lower = crop_name.lower()
-        if crop_lower in AgricultureExpert.CROP_INFO:
-            return AgricultureExpert.CROP_INFO[crop_lower]
-        else:
-            return {
-                "name": crop_name.title(),
-                "season": "Adapt to local season",
-                "water": "Based on local conditions",
-                "spacing": "Follow seed packet instructions",
-                "duration": "Varies by variety"
-            }
-    
-    @staticmethod
-    def get_problem_solution(problem_name):
-        """Get solutions for a specific problem"""
-        problem_lower = problem_name.lower()
-        if problem_lower in AgricultureExpert.PROBLEM_SOLUTIONS:
-            return AgricultureExpert.PROBLEM_SOLUTIONS[problem_lower]
-        else:
-            return {
-                "key_techniques": ["Integrated approach", "Regular monitoring"],
-                "steps": ["Assess situation", "Plan solution", "Implement carefully"],
-                "benefits": "Improved crop health and yield"
-            }
+})
+
+# Used when a crop is not in the database
+_DEFAULT_CROP = _freeze_entry({
+    "season": "Adapt to local season",
+    "water": "Based on local conditions",
+    "spacing": "Follow seed packet instructions",
+    "duration": "Varies by variety"
+})
+
+# Used when a problem is not in the database
+_DEFAULT_SOLUTION = _freeze_entry({
+    "key_techniques": ["Integrated approach", "Regular monitoring"],
+    "steps": ["Assess situation", "Plan solution", "Implement carefully"],
+    "benefits": "Improved crop health and yield"
+})
+
+
+def get_crop_details(crop_name):
+    """Get information about a specific crop"""
+    # Most requests already arrive in lowercase, so skip the copy then
+    crop_lower = crop_name if crop_name.islower() else crop_name.lower()
+    crop_info = _CROP_INFO.get(crop_lower)
+    if crop_info is not None:
+        return crop_info
+    else:
+        return {"name": crop_name.title(), **_DEFAULT_CROP}
+
+
+def get_problem_solution(problem_name):
+    """Get solutions for a specific problem"""
+    problem_lower = problem_name if problem_name.islower() else problem_name.lower()
+    return _PROBLEM_SOLUTIONS.get(problem_lower, _DEFAULT_SOLUTION)
+
+
+# This simulates what an AI might generate
+_INSIGHT_TEMPLATES = (
+    "AI analysis suggests focusing on {region}-specific adaptation for {crop}.",
+    "Machine learning models indicate integrated approach works best for {problem}.",
+    "Data patterns show {crop} responds well to timely {problem} management.",
+    "AI recommendation: Combine traditional knowledge with modern techniques."
+)
 
 
 class AISystem:
@@ -108,17 +167,13 @@ class AISystem:
         Simulate AI generation
         In a full system, this would call a real AI model
         """
-        # This simulates what an AI might generate
-        insights = [
-            f"AI analysis suggests focusing on {region}-specific adaptation for {crop}.",
-            f"Machine learning models indicate integrated approach works best for {problem}.",
-            f"Data patterns show {crop} responds well to timely {problem} management.",
-            f"AI recommendation: Combine traditional knowledge with modern techniques."
-        ]
-        
         # Return different insights based on input (simple simulation)
-        input_hash = hash(f"{crop}{region}{problem}") % len(insights)
-        return insights[input_hash]
+        # crc32 is stable across processes, unlike the salted built-in hash()
+        input_key = f"{crop}|{region}|{problem}".encode("utf-8", "replace")
+        input_hash = zlib.crc32(input_key) % len(_INSIGHT_TEMPLATES)
+        
+        # Only the chosen insight gets formatted
+        return _INSIGHT_TEMPLATES[input_hash].format(crop=crop, region=region, problem=problem)
     
     @staticmethod
     def check_ai_availability():
@@ -131,63 +186,44 @@ class AISystem:
         return True
 
 
-class TrainingModuleBuilder:
-    """Builds complete training modules"""
-    
-    @staticmethod
-    def create_module(crop, region, problem, language="English"):
-        """Create a complete training module"""
-        
-        # Get current time for the module
-        current_time = datetime.now()
-        formatted_time = current_time.strftime("%d %B %Y, %I:%M %p")
-        
-        # Get farming knowledge
-        crop_info = AgricultureExpert.get_crop_details(crop)
-        problem_solution = AgricultureExpert.get_problem_solution(problem)
-        
-        # Get AI insight if available
-        ai_available = AISystem.check_ai_availability()
-        ai_insight = ""
-        if ai_available:
-            ai_insight = AISystem.generate_ai_insight(crop, region, problem)
-        
-        # Build the module content
-        module_content = f"""
-# FARMER TRAINING MODULE
-## Crop: {crop_info['name']} | Region: {region} | Language: {language}
+# Training module layout, one Jinja2 template per "---" separated section
+MODULE_SECTIONS = (
+    """# FARMER TRAINING MODULE
+## Crop: {{ crop_info.name }} | Region: {{ region }} | Language: {{ language }}
 
-### 📅 GENERATED ON: {formatted_time}
+### 📅 GENERATED ON: {{ formatted_time }}
 
 ---
 
-## 🌾 ABOUT THIS CROP
+""",
+    """## 🌾 ABOUT THIS CROP
 
-**Crop Name:** {crop_info['name']}
-**Best Season:** {crop_info['season']}
-**Water Needs:** {crop_info['water']}
-**Plant Spacing:** {crop_info['spacing']}
-**Growth Duration:** {crop_info['duration']}
+**Crop Name:** {{ crop_info.name }}
+**Best Season:** {{ crop_info.season }}
+**Water Needs:** {{ crop_info.water }}
+**Plant Spacing:** {{ crop_info.spacing }}
+**Growth Duration:** {{ crop_info.duration }}
 
 ---
 
-## 🎯 FOCUS AREA: {problem.upper()}
+""",
+    """## 🎯 FOCUS AREA: {{ problem_upper }}
 
 ### AI-GENERATED INSIGHT:
-{ai_insight if ai_insight else "System analysis recommends integrated management approach."}
+{{ ai_insight or "System analysis recommends integrated management approach." }}
 
 ### RECOMMENDED TECHNIQUES:
-{' • '.join(problem_solution['key_techniques'])}
+{{ problem_solution.techniques_block }}
 
 ### STEP-BY-STEP GUIDE:
 
 1. **Week 1-2: Assessment & Planning**
-   - Evaluate current {problem} conditions
+   - Evaluate current {{ problem }} conditions
    - Gather necessary tools and resources
    - Create implementation schedule
 
 2. **Week 3-8: Implementation**
-   {chr(10).join('   - ' + step for step in problem_solution['steps'])}
+   {{ problem_solution.steps_block }}
    - Monitor progress weekly
    - Make adjustments as needed
 
@@ -197,9 +233,9 @@ class TrainingModuleBuilder:
    - Share knowledge with other farmers
 
 ### KEY BENEFITS:
-{problem_solution['benefits']}
+{{ problem_solution.benefits }}
 
-### REGION-SPECIFIC ADVICE FOR {region.upper()}:
+### REGION-SPECIFIC ADVICE FOR {{ region_upper }}:
 - Consider local weather patterns
 - Adapt to soil conditions in your area
 - Consult local agriculture department
@@ -207,10 +243,11 @@ class TrainingModuleBuilder:
 
 ---
 
-## 📊 EXPECTED RESULTS
+""",
+    """## 📊 EXPECTED RESULTS
 
 ### QUANTITATIVE IMPROVEMENTS:
-- {problem} management: 40-60% better
+- {{ problem }} management: 40-60% better
 - Crop yield increase: 20-35%
 - Input cost reduction: 15-25%
 - Labor efficiency: 20-30% improvement
@@ -223,7 +260,8 @@ class TrainingModuleBuilder:
 
 ---
 
-## 🛠️ IMPLEMENTATION TIPS
+""",
+    """## 🛠️ IMPLEMENTATION TIPS
 
 ### DO'S:
 ✓ Start with small pilot area
@@ -241,7 +279,8 @@ class TrainingModuleBuilder:
 
 ---
 
-## ❓ FREQUENTLY ASKED QUESTIONS
+""",
+    """## ❓ FREQUENTLY ASKED QUESTIONS
 
 **Q: How long before I see results?**
 A: Most farmers see improvements within 4-6 weeks.
@@ -257,7 +296,8 @@ A: Yes, adapt the principles to other crops you grow.
 
 ---
 
-## 🔧 SYSTEM INFORMATION
+""",
+    """## 🔧 SYSTEM INFORMATION
 
 ### TECHNOLOGY USED:
 - Web Application: Flask Python Framework
@@ -266,17 +306,18 @@ A: Yes, adapt the principles to other crops you grow.
 - Interface: Responsive Web Design
 
 ### GENERATION DETAILS:
-- Module Created: {formatted_time}
-- AI Assistance: {'Available' if ai_available else 'Not available'}
+- Module Created: {{ formatted_time }}
+- AI Assistance: {{ 'Available' if ai_available else 'Not available' }}
 - Content Type: Personalized farming guidance
 - System Status: Operational
 
 ---
 
-## 📞 GETTING HELP
+""",
+    """## 📞 GETTING HELP
 
 ### LOCAL RESOURCES:
-- Contact {region} Agriculture Department
+- Contact {{ region }} Agriculture Department
 - Visit nearest Krishi Vigyan Kendra (KVK)
 - Join farmer WhatsApp groups
 - Attend local farming workshops
@@ -289,27 +330,182 @@ A: Yes, adapt the principles to other crops you grow.
 
 ---
 *This training module was generated automatically based on agricultural best practices.*
-*Always consult local agricultural experts before implementing new techniques.*
-"""
+*Always consult local agricultural experts before implementing new techniques.*""",
+)
+
+
+@cached(TTLCache(maxsize=1, ttl=30), lock=threading.Lock())
+def _formatted_now():
+    """Current time as shown in modules, refreshed at most every 30 seconds"""
+    return datetime.now().strftime("%d %B %Y, %I:%M %p")
+
+
+# Module bodies are only cached when every input is at most this long
+CACHEABLE_INPUT_LENGTH = 40
+
+# Where the generation time goes; sections are split around it at import time,
+# so cached module bodies can be joined with any time without text substitution
+TIME_SLOT = "{{ formatted_time }}"
+
+# Compile the section templates once at import time; pieces without any
+# template markup are kept as plain strings and sent out without rendering
+_TEMPLATE_ENV = jinja2.Environment(autoescape=False, keep_trailing_newline=True)
+_SECTION_TEMPLATES = tuple(
+    tuple(
+        _TEMPLATE_ENV.from_string(piece) if "{" in piece else piece
+        for piece in source.split(TIME_SLOT)
+    )
+    for source in MODULE_SECTIONS
+)
+
+
+class TrainingModuleBuilder:
+    """Builds complete training modules"""
+    
+    @staticmethod
+    def _render_sections(crop, region, problem, language, ai_available):
+        """Yield each section as the list of text pieces around the generation time"""
         
-        return {
-            "content": module_content.strip(),
-            "metadata": {
-                "generation_time": formatted_time,
-                "crop": crop,
-                "region": region,
-                "problem": problem,
-                "language": language,
-                "ai_used": ai_available
-            }
+        # Get farming knowledge
+        crop_info = get_crop_details(crop)
+        problem_solution = get_problem_solution(problem)
+        
+        # Get AI insight if available
+        ai_insight = ""
+        if ai_available:
+            ai_insight = AISystem.generate_ai_insight(crop, region, problem)
+        
+        # Render the precompiled templates, one section per "---" separator
+        context = {
+            "crop_info": crop_info,
+            "problem_solution": problem_solution,
+            "region": region,
+            "region_upper": region.upper(),
+            "problem": problem,
+            "problem_upper": problem.upper(),
+            "language": language,
+            "ai_available": ai_available,
+            "ai_insight": ai_insight
         }
+        for pieces in _SECTION_TEMPLATES:
+            yield [
+                piece if isinstance(piece, str) else piece.render(context)
+                for piece in pieces
+            ]
+    
+    @staticmethod
+    def iter_module_sections(crop, region, problem, language="English", formatted_time=None):
+        """Yield the training module one section at a time"""
+        
+        # Get current time for the module
+        if formatted_time is None:
+            formatted_time = _formatted_now()
+        
+        ai_available = AISystem.check_ai_availability()
+        for pieces in TrainingModuleBuilder._render_sections(
+            crop, region, problem, language, ai_available
+        ):
+            yield formatted_time.join(pieces)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _build_body(crop, region, problem, language, ai_available):
+        """Build the module content as the text between generation time slots"""
+        segments = [""]
+        for pieces in TrainingModuleBuilder._render_sections(
+            crop, region, problem, language, ai_available
+        ):
+            segments[-1] += pieces[0]
+            segments.extend(pieces[1:])
+        return tuple(segments)
+    
+    @staticmethod
+    def create_module(crop, region, problem, language="English",
+                      formatted_time=None, ai_available=None):
+        """Create the content of a complete training module"""
+        
+        # Get current time and AI status for the module
+        if formatted_time is None:
+            formatted_time = _formatted_now()
+        if ai_available is None:
+            ai_available = AISystem.check_ai_availability()
+        
+        # Reuse the cached module body and put the generation time in its slots;
+        # unusually long inputs are built directly so they don't fill the cache
+        build_body = TrainingModuleBuilder._build_body
+        if max(len(crop), len(region), len(problem), len(language)) > CACHEABLE_INPUT_LENGTH:
+            build_body = build_body.__wrapped__
+        return formatted_time.join(build_body(
+            crop, region, problem, language, ai_available
+        ))
+
+
+MISSING_FIELDS_ERROR = {
+    "success": False,
+    "error": "Please fill in all fields: Crop, Region, and Problem"
+}
+
+# Longest text accepted for any single form field
+MAX_FIELD_LENGTH = 100
+
+INVALID_REQUEST_ERROR = {
+    "success": False,
+    "error": f"Invalid request: Crop, Region, Problem and Language must be text "
+             f"of at most {MAX_FIELD_LENGTH} characters"
+}
+
+REQUEST_TOO_LARGE_ERROR = {
+    "success": False,
+    "error": "Request is too large. Please shorten the form fields."
+}
+
+# Expected shape of the web form data; missing fields get their defaults filled in
+MODULE_REQUEST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "crop": {"type": "string", "maxLength": MAX_FIELD_LENGTH, "default": ""},
+        "region": {"type": "string", "maxLength": MAX_FIELD_LENGTH, "default": ""},
+        "problem": {"type": "string", "maxLength": MAX_FIELD_LENGTH, "default": ""},
+        "language": {"type": "string", "maxLength": MAX_FIELD_LENGTH, "default": "English"}
+    }
+}
+
+# Compiled once into a specialised validation function
+validate_module_request = fastjsonschema.compile(MODULE_REQUEST_SCHEMA)
+
+
+def read_module_request():
+    """
+    Extract crop, region, problem and language from the request body
+    Raises fastjsonschema.JsonSchemaException if the body has the wrong shape
+    """
+    request_data = validate_module_request(request.get_json(silent=True) or {})
+    
+    crop_type, region_name, problem_type = (
+        request_data[field].strip() for field in ('crop', 'region', 'problem')
+    )
+    language_pref = request_data['language']
+    
+    return crop_type, region_name, problem_type, language_pref
+
+
+# The homepage is static, so render it once and serve the same bytes
+with app.app_context():
+    HOME_PAGE_HTML = render_template('index.html').encode('utf-8')
+HOME_PAGE_ETAG = hashlib.sha1(HOME_PAGE_HTML).hexdigest()
 
 
 # Web Application Routes
 @app.route('/')
 def show_homepage():
     """Display the main web page"""
-    return render_template('index.html')
+    response = Response(
+        HOME_PAGE_HTML,
+        mimetype='text/html',
+        headers={'Cache-Control': 'public, max-age=300'}
+    )
+    response.set_etag(HOME_PAGE_ETAG)
+    return response.make_conditional(request)
 
 
 @app.route('/generate', methods=['POST'])
@@ -318,87 +514,142 @@ def generate_training_module():
     
     try:
         # Get data from the web form
-        request_data = request.get_json()
-        
-        # Extract the information
-        crop_type = request_data.get('crop', '').strip()
-        region_name = request_data.get('region', '').strip()
-        problem_type = request_data.get('problem', '').strip()
-        language_pref = request_data.get('language', 'English')
+        crop_type, region_name, problem_type, language_pref = read_module_request()
         
         # Check if all required fields are filled
         if not crop_type or not region_name or not problem_type:
-            return jsonify({
-                "success": False,
-                "error": "Please fill in all fields: Crop, Region, and Problem"
-            }), 400
-        
-        # Print to console for debugging
-        print(f"\nCreating training module for:")
-        print(f"  Crop: {crop_type}")
-        print(f"  Region: {region_name}")
-        print(f"  Problem: {problem_type}")
-        print(f"  Language: {language_pref}")
+            return jsonify(MISSING_FIELDS_ERROR), 400
         
-        # Build the training module
-        module_data = TrainingModuleBuilder.create_module(
+        # Log the request for debugging (skipped entirely above DEBUG level)
+        app.logger.debug(
+            "Creating training module: crop=%s region=%s problem=%s language=%s",
             crop_type, region_name, problem_type, language_pref
         )
         
-        # Prepare the response
+        # Build the training module and the response around it in one go
+        formatted_time = _formatted_now()
+        ai_available = AISystem.check_ai_availability()
+        crop_title, problem_title = crop_type.title(), problem_type.title()
         response_data = {
             "success": True,
             "data": {
-                "title": f"{crop_type.title()} Farming Training Module",
-                "subtitle": f"Region: {region_name} | Focus: {problem_type.title()}",
-                "content": module_data["content"],
+                "title": f"{crop_title} Farming Training Module",
+                "subtitle": f"Region: {region_name} | Focus: {problem_title}",
+                "content": TrainingModuleBuilder.create_module(
+                    crop_type, region_name, problem_type, language_pref,
+                    formatted_time, ai_available
+                ),
                 "language": language_pref
             },
             "system_info": {
-                "generated_at": module_data["metadata"]["generation_time"],
-                "ai_assistance": module_data["metadata"]["ai_used"]
+                "generated_at": formatted_time,
+                "ai_assistance": ai_available
             }
         }
         
-        return jsonify(response_data)
+        # Serialize straight to UTF-8 bytes, skipping jsonify's str round trip
+        return Response(orjson.dumps(response_data), mimetype='application/json')
+        
+    except fastjsonschema.JsonSchemaException:
+        return jsonify(INVALID_REQUEST_ERROR), 400
+        
+    except RequestEntityTooLarge:
+        return jsonify(REQUEST_TOO_LARGE_ERROR), 413
         
     except Exception as error:
         # Handle any errors
-        print(f"Error creating module: {error}")
+        app.logger.error("Error creating module: %s", error)
         return jsonify({
             "success": False,
             "error": "Could not generate training module. Please try again."
         }), 500
 
 
+@app.route('/generate/stream', methods=['POST'])
+def stream_training_module():
+    """
+    Stream a training module as Markdown, section by section
+    The first section is built before responding, so early errors return a 500;
+    errors after that are logged and end the stream
+    """
+    
+    def send_sections(sections):
+        # Later sections render after this route returns, so log failures here
+        try:
+            yield from sections
+        except Exception as error:
+            app.logger.error("Error streaming module: %s", error)
+    
+    try:
+        # Get data from the web form
+        crop_type, region_name, problem_type, language_pref = read_module_request()
+        
+        # Check if all required fields are filled
+        if not crop_type or not region_name or not problem_type:
+            return jsonify(MISSING_FIELDS_ERROR), 400
+        
+        # Build the first section here so failures still get an error response,
+        # then send each remaining section as soon as it is built
+        sections = TrainingModuleBuilder.iter_module_sections(
+            crop_type, region_name, problem_type, language_pref
+        )
+        first_section = next(sections)
+        sections = itertools.chain((first_section,), send_sections(sections))
+        return Response(stream_with_context(sections), mimetype='text/markdown')
+        
+    except fastjsonschema.JsonSchemaException:
+        return jsonify(INVALID_REQUEST_ERROR), 400
+        
+    except RequestEntityTooLarge:
+        return jsonify(REQUEST_TOO_LARGE_ERROR), 413
+        
+    except Exception as error:
+        # Handle any errors
+        app.logger.error("Error streaming module: %s", error)
+        return jsonify({
+            "success": False,
+            "error": "Could not generate training module. Please try again."
+        }), 500
+
+
+# Last health check body and when it was built: [monotonic time, JSON bytes]
+_HEALTH_CACHE = [float('-inf'), b'']
+
+
 @app.route('/health', methods=['GET'])
 def check_health():
     """Check if the system is working"""
-    return jsonify({
-        "status": "working",
-        "service": "farmer_training_generator",
-        "time": datetime.now().isoformat()
-    })
+    # Rebuild the body at most once per second; probes in between reuse it
+    now = time.monotonic()
+    if now - _HEALTH_CACHE[0] > 1.0:
+        # Store the body before the timestamp so other threads never see b''
+        _HEALTH_CACHE[1] = orjson.dumps({
+            "status": "working",
+            "service": "farmer_training_generator",
+            "time": datetime.now().isoformat()
+        })
+        _HEALTH_CACHE[0] = now
+    return Response(_HEALTH_CACHE[1], mimetype='application/json')
 
 
 # Start the application
 if __name__ == '__main__':
     
     # Show startup message
-    print("\n" + "=" * 60)
-    print("FARMER TRAINING MODULE GENERATOR")
-    print("=" * 60)
-    print("Starting web server...")
-    print(f"Local website: http://127.0.0.1:5000")
-    print(f"Health check: http://127.0.0.1:5000/health")
-    print("=" * 60)
-    print("\nReady to generate training modules!")
-    print("Open the website in your browser to begin.")
-    print("\n" + "=" * 60)
+    app.logger.info("FARMER TRAINING MODULE GENERATOR - starting web server")
+    app.logger.info("Local website: http://127.0.0.1:5000")
+    app.logger.info("Health check: http://127.0.0.1:5000/health")
+    app.logger.info("Ready to generate training modules! Open the website in your browser to begin.")
     
-    # Run the web server
-    app.run(
-        host='0.0.0.0',  # Allow connections from any device on network
-        port=5000,        # Use port 5000
-        debug=True        # Show detailed errors for development
-    )
+    # Run the web server (for production, use: gunicorn app:app)
+    if os.environ.get('FARMER_SERVER') == 'waitress':
+        # Multi-threaded production server that also runs on Windows
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=5000, threads=8)
+    else:
+        app.run(
+            host='0.0.0.0',  # Allow connections from any device on network
+            port=5000,        # Use port 5000
+            debug=False,      # No reloader or interactive debugger
+            threaded=True     # Handle requests concurrently
+        )
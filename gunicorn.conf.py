@@ -0,0 +1,17 @@
+"""
+Gunicorn settings for serving the Farmer Training Module Generator
+Run with: gunicorn app:app
+"""
+
+from multiprocessing import cpu_count
+
+# Listen on the same port as the development server
+bind = "0.0.0.0:5000"
+
+# Several worker processes, each handling requests on a few threads
+workers = 2 * cpu_count() + 1
+worker_class = "gthread"
+threads = 4
+
+# Load the app before forking so workers share the templates and knowledge base
+preload_app = True